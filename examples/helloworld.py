@@ -1,22 +1,42 @@
 #!/usr/bin/env python3
 """Script to deliberately exhaust memory to test podman-sandbox memory limit (512MB)."""
 
+import mmap
 import sys
 
-print("Memory stress test: Attempting to allocate lots of memory inside the sandbox...", flush=True)
+CHUNK_SIZE = 10 * 1024 * 1024  # Allocate 10MB per step, so we hit 512MB quickly.
+PAGE_SIZE = 4096
 
-mem_chunks = []
+# Buffer output; one explicit flush before exiting is enough, and per-line
+# flush syscalls are the last thing we want while sitting at the memory limit.
+sys.stdout.reconfigure(line_buffering=False)
+
+print("Memory stress test: Attempting to allocate lots of memory inside the sandbox...")
+
+# Pre-size for the ~60 chunks a 512MB limit allows so list growth doesn't
+# allocate mid-stress; grows past that only if the limit never kicks in.
+mem_chunks = [None] * 60
 try:
     i = 0
     while True:
-        # Allocate 10MB per step, so we hit 512MB quickly.
-        mem_chunks.append(bytearray(10 * 1024 * 1024))
+        # Anonymous private mapping instead of bytearray: no Python-side
+        # zero-fill, so the cgroup limit is what gets exercised.
+        chunk = mmap.mmap(-1, CHUNK_SIZE, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        # Touch one byte per page to force the kernel to actually commit it.
+        for offset in range(0, CHUNK_SIZE, PAGE_SIZE):
+            chunk[offset] = 1
+        if i < len(mem_chunks):
+            mem_chunks[i] = chunk
+        else:
+            mem_chunks.append(chunk)
         i += 1
-        if i % 10 == 0:
-            print(f"Allocated {i*10}MB so far...", flush=True)
-except MemoryError:
-    print("MemoryError caught! The sandbox memory limit was reached.", flush=True)
-    print(f"Stopped after allocating approximately {i*10}MB.", flush=True)
+        if i % 25 == 0:
+            print(f"Allocated {i*10}MB so far...")
+except (MemoryError, OSError):
+    print("MemoryError caught! The sandbox memory limit was reached.")
+    print(f"Stopped after allocating approximately {i*10}MB.")
+    sys.stdout.flush()
     sys.exit(42)
 
 print("Finished without hitting the memory limit? This is unexpected!")
+sys.stdout.flush()
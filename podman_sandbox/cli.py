@@ -2,32 +2,72 @@
 
 import sys
 import click
-from .container import PodmanContainer
+
+# Precomputed ANSI codes for hot echo paths (list's per-container loop and
+# configure's diff) so we don't pay a click.style() call per fragment.
+# click.echo still strips these when output isn't a terminal.
+_RESET = '\x1b[0m'
+_BOLD = '\x1b[1m'
+_RED = '\x1b[31m'
+_GREEN = '\x1b[32m'
+_YELLOW = '\x1b[33m'
+_BLUE = '\x1b[34m'
+_CYAN = '\x1b[36m'
+_BRIGHT_BLACK = '\x1b[90m'
+_GREEN_BOLD = _GREEN + _BOLD
+_CYAN_BOLD = _CYAN + _BOLD
+
+
+def _can_exec_replace():
+    """Whether it's safe to replace this process with podman.
+
+    False when the CLI is being driven in-process (e.g. CliRunner in tests
+    or programmatic callers capturing output through swapped streams).
+    """
+    return sys.stdout is sys.__stdout__ and sys.stderr is sys.__stderr__
 
 
 @click.group()
 @click.version_option()
-def main():
+@click.pass_context
+def main(ctx):
     """Podman Sandbox - Easily sandbox code execution in Podman containers."""
-    pass
+    ctx.ensure_object(dict)
+
+
+def _get_container(ctx):
+    """Construct the shared PodmanContainer on first use.
+
+    Keeps the config read and container setup off the path of invocations
+    that never touch a container (group dispatch, subcommand --help).
+    """
+    container = ctx.obj.get('container')
+    if container is None:
+        from .container import PodmanContainer
+        container = ctx.obj['container'] = PodmanContainer()
+    return container
 
 
 @main.command()
 @click.option("--image", default=None, help="Container image to use (default: alpine:latest)")
-def start(image):
+@click.pass_context
+def start(ctx, image):
     """Start the sandbox container."""
-    container = PodmanContainer()
+    container = _get_container(ctx)
 
     if image:
         container.configure(image=image)
 
+    from .container import _HOME
+
     try:
         container.start()
+        cfg = container.config
         click.echo(click.style("✓ Sandbox container started successfully", fg='green', bold=True))
-        click.echo(f"  Image: {click.style(container.config['image'], fg='blue')}")
-        click.echo(f"  Working directory: {click.style('/workspace', fg='cyan')} (mounted from {container.CONFIG_DIR.parent.parent})")
-        if container.config.get("memory_limit"):
-            click.echo(f"  Memory limit: {click.style(container.config['memory_limit'], fg='cyan')}")
+        click.echo(f"  Image: {click.style(cfg['image'], fg='blue')}")
+        click.echo(f"  Working directory: {click.style('/workspace', fg='cyan')} (mounted from {_HOME})")
+        if cfg.get("memory_limit"):
+            click.echo(f"  Memory limit: {click.style(cfg['memory_limit'], fg='cyan')}")
     except RuntimeError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -37,13 +77,14 @@ def start(image):
 
 
 @main.command()
-def stop():
+@click.pass_context
+def stop(ctx):
     """Stop the sandbox container.
 
     If auto-commit is enabled, the container state will be automatically
     saved before stopping.
     """
-    container = PodmanContainer()
+    container = _get_container(ctx)
 
     try:
         committed = container.stop()
@@ -61,7 +102,9 @@ def stop():
 @main.command()
 @click.argument("command")
 @click.option("-i", "--interactive", is_flag=True, help="Run in interactive mode")
-def execute(command, interactive):
+@click.option("--fast", is_flag=True, help="Skip the running/mount checks and exec directly (container must already be started)")
+@click.pass_context
+def execute(ctx, command, interactive, fast):
     """Execute a command in the sandbox container.
 
     The container automatically starts if not running and remounts if you've changed directories.
@@ -71,25 +114,45 @@ def execute(command, interactive):
         sandbox execute "python helloworld.py"
         sandbox execute -i "bash"
     """
-    container = PodmanContainer()
+    from .container import _same_directory
+    container = _get_container(ctx)
 
     try:
-        import os
-        current_dir = os.getcwd()
+        current_dir = container._cwd
+
+        if fast:
+            # User vouches the sandbox is up: no inspect, and where possible
+            # hand the process over to podman entirely.
+            if _can_exec_replace():
+                container.exec_replace(command, interactive)
+            result = container.execute(command, interactive=interactive, verify=False)
+            sys.exit(result.returncode)
+
+        # One inspect covers both the running check and the mount check
+        info = container.inspect()
 
         # Auto-start if not running
-        if not container.is_running():
+        if not info["running"]:
             click.echo(click.style("Container not running, starting...", fg='yellow'))
             container.start()
             click.echo("")
 
         # Check if we need to restart for directory change
-        mounted_dir = container.get_mounted_directory()
-        if mounted_dir and mounted_dir != current_dir and container.is_running():
+        mounted_dir = info["mounted_dir"]
+        needs_restart = (
+            mounted_dir and info["running"] and not _same_directory(mounted_dir, current_dir)
+        )
+        if needs_restart:
             click.echo(click.style("Directory changed, restarting container...", fg='yellow'))
             click.echo(f"  Old: {click.style(mounted_dir, fg='red')}")
             click.echo(f"  New: {click.style(current_dir, fg='green')}")
 
+        if not needs_restart and _can_exec_replace():
+            # Preflight passed and no remount is pending: hand the process
+            # over to podman instead of idling in subprocess.run for the
+            # child's lifetime. Exit status propagates natively.
+            container.exec_replace(command, interactive=interactive)
+
         result = container.execute(command, interactive=interactive)
         sys.exit(result.returncode)
     except RuntimeError as e:
@@ -106,7 +169,8 @@ def execute(command, interactive):
 @click.option("--auto-commit/--no-auto-commit", default=None, help="Enable/disable auto-commit on stop")
 @click.option("--show", is_flag=True, help="Show current configuration")
 @click.option("--no-restart", is_flag=True, help="Don't restart the container automatically")
-def configure(memory, image, auto_commit, show, no_restart):
+@click.pass_context
+def configure(ctx, memory, image, auto_commit, show, no_restart):
     """Configure sandbox container settings.
 
     Examples:
@@ -116,17 +180,24 @@ def configure(memory, image, auto_commit, show, no_restart):
         sandbox configure --no-auto-commit  # Disable auto-commit
         sandbox configure --show
     """
-    container = PodmanContainer()
-
     if show:
+        # Read-only path: go straight to the config file so scripted
+        # `configure --show` calls skip container setup entirely.
+        from .container import read_config_only
+
+        cfg = read_config_only()
+        ac = cfg.get('auto_commit', False)
         click.echo(click.style("Current configuration:", bold=True))
-        click.echo(f"  Image: {click.style(container.config['image'], fg='blue')}")
-        click.echo(f"  Memory limit: {click.style(container.config.get('memory_limit') or 'unlimited', fg='blue')}")
-        auto_commit_status = "enabled" if container.config.get('auto_commit', False) else "disabled"
-        auto_commit_color = 'green' if container.config.get('auto_commit', False) else 'yellow'
+        click.echo(f"  Image: {click.style(cfg['image'], fg='blue')}")
+        click.echo(f"  Memory limit: {click.style(cfg.get('memory_limit') or 'unlimited', fg='blue')}")
+        auto_commit_status = "enabled" if ac else "disabled"
+        auto_commit_color = 'green' if ac else 'yellow'
         click.echo(f"  Auto-commit: {click.style(auto_commit_status, fg=auto_commit_color)}")
         return
 
+    container = _get_container(ctx)
+    cfg = container.config
+
     if not memory and not image and auto_commit is None:
         click.echo("Error: No configuration options provided", err=True)
         click.echo("Use --memory, --image, --auto-commit, or --show to view current config")
@@ -135,9 +206,9 @@ def configure(memory, image, auto_commit, show, no_restart):
     try:
         # Store old config for comparison
         old_config = {
-            "image": container.config['image'],
-            "memory_limit": container.config.get('memory_limit') or 'unlimited',
-            "auto_commit": container.config.get('auto_commit', False)
+            "image": cfg['image'],
+            "memory_limit": cfg.get('memory_limit') or 'unlimited',
+            "auto_commit": cfg.get('auto_commit', False)
         }
 
         # Update configuration
@@ -145,51 +216,52 @@ def configure(memory, image, auto_commit, show, no_restart):
 
         # New config after update
         new_config = {
-            "image": container.config['image'],
-            "memory_limit": container.config.get('memory_limit') or 'unlimited',
-            "auto_commit": container.config.get('auto_commit', False)
+            "image": cfg['image'],
+            "memory_limit": cfg.get('memory_limit') or 'unlimited',
+            "auto_commit": cfg.get('auto_commit', False)
         }
 
-        # Display pretty diff with colors
-        click.echo(click.style("Configuration changes:", bold=True))
-        click.echo("")
+        # Build the pretty diff in one buffer and emit it with a single write
+        out = [f"{_BOLD}Configuration changes:{_RESET}", ""]
 
         if old_config['image'] != new_config['image']:
-            click.echo(f"  {click.style('Image:', bold=True)}")
-            click.echo(f"    {click.style('-', fg='red')} {click.style(old_config['image'], fg='red')}")
-            click.echo(f"    {click.style('+', fg='green')} {click.style(new_config['image'], fg='green')}")
+            out.append(f"  {_BOLD}Image:{_RESET}")
+            out.append(f"    {_RED}-{_RESET} {_RED}{old_config['image']}{_RESET}")
+            out.append(f"    {_GREEN}+{_RESET} {_GREEN}{new_config['image']}{_RESET}")
         else:
-            click.echo(f"  Image: {click.style(new_config['image'], fg='blue')} {click.style('(unchanged)', fg='bright_black')}")
+            out.append(f"  Image: {_BLUE}{new_config['image']}{_RESET} {_BRIGHT_BLACK}(unchanged){_RESET}")
 
         if old_config['memory_limit'] != new_config['memory_limit']:
-            click.echo(f"  {click.style('Memory limit:', bold=True)}")
-            click.echo(f"    {click.style('-', fg='red')} {click.style(old_config['memory_limit'], fg='red')}")
-            click.echo(f"    {click.style('+', fg='green')} {click.style(new_config['memory_limit'], fg='green')}")
+            out.append(f"  {_BOLD}Memory limit:{_RESET}")
+            out.append(f"    {_RED}-{_RESET} {_RED}{old_config['memory_limit']}{_RESET}")
+            out.append(f"    {_GREEN}+{_RESET} {_GREEN}{new_config['memory_limit']}{_RESET}")
         else:
-            click.echo(f"  Memory limit: {click.style(new_config['memory_limit'], fg='blue')} {click.style('(unchanged)', fg='bright_black')}")
+            out.append(f"  Memory limit: {_BLUE}{new_config['memory_limit']}{_RESET} {_BRIGHT_BLACK}(unchanged){_RESET}")
 
         if old_config['auto_commit'] != new_config['auto_commit']:
-            click.echo(f"  {click.style('Auto-commit:', bold=True)}")
+            out.append(f"  {_BOLD}Auto-commit:{_RESET}")
             old_status = "enabled" if old_config['auto_commit'] else "disabled"
             new_status = "enabled" if new_config['auto_commit'] else "disabled"
-            click.echo(f"    {click.style('-', fg='red')} {click.style(old_status, fg='red')}")
-            click.echo(f"    {click.style('+', fg='green')} {click.style(new_status, fg='green')}")
+            out.append(f"    {_RED}-{_RESET} {_RED}{old_status}{_RESET}")
+            out.append(f"    {_GREEN}+{_RESET} {_GREEN}{new_status}{_RESET}")
         else:
             auto_status = "enabled" if new_config['auto_commit'] else "disabled"
-            click.echo(f"  Auto-commit: {click.style(auto_status, fg='blue')} {click.style('(unchanged)', fg='bright_black')}")
+            out.append(f"  Auto-commit: {_BLUE}{auto_status}{_RESET} {_BRIGHT_BLACK}(unchanged){_RESET}")
 
-        click.echo("")
+        out.append("")
+        click.echo("\n".join(out))
 
         # Auto-restart if container is running
         was_running = container.is_running()
 
         if was_running and not no_restart:
-            click.echo(click.style("Restarting container to apply changes...", fg='yellow'))
+            click.echo(click.style("Applying changes to the running container...", fg='yellow'))
             try:
-                container.stop(skip_commit=True)  # Skip auto-commit during config restart
-                click.echo(f"  {click.style('✓', fg='green')} Container stopped")
-                container.start()
-                click.echo(f"  {click.style('✓', fg='green')} Container started with new configuration")
+                action = container.restart()
+                if action == "updated":
+                    click.echo(f"  {click.style('✓', fg='green')} Memory limit updated in place (no restart needed)")
+                else:
+                    click.echo(f"  {click.style('✓', fg='green')} Container recreated with new configuration")
                 click.echo("")
                 click.echo(click.style("Configuration applied successfully!", fg='green', bold=True))
             except Exception as e:
@@ -210,12 +282,20 @@ def configure(memory, image, auto_commit, show, no_restart):
 
 
 @main.command()
-def status():
+@click.option("--json", "as_json", is_flag=True, help="Output status as JSON")
+@click.pass_context
+def status(ctx, as_json):
     """Show sandbox container status."""
-    container = PodmanContainer()
+    container = _get_container(ctx)
 
     try:
         info = container.status()
+        if as_json:
+            import json
+
+            info["config"] = container.config
+            click.echo(json.dumps(info, indent=2))
+            return
         click.echo(click.style("Sandbox container status:", bold=True))
 
         # Color status based on running state
@@ -235,11 +315,13 @@ def status():
         if info.get("memory_limit"):
             click.echo(f"  Memory limit: {click.style(info['memory_limit'], fg='cyan')}")
 
+        cfg = container.config
+        ac = cfg.get('auto_commit', False)
         click.echo(f"\n{click.style('Configuration:', bold=True)}")
-        click.echo(f"  Image: {click.style(container.config['image'], fg='blue')}")
-        click.echo(f"  Memory limit: {click.style(container.config.get('memory_limit') or 'unlimited', fg='blue')}")
-        auto_commit_status = "enabled" if container.config.get('auto_commit', False) else "disabled"
-        auto_commit_color = 'green' if container.config.get('auto_commit', False) else 'yellow'
+        click.echo(f"  Image: {click.style(cfg['image'], fg='blue')}")
+        click.echo(f"  Memory limit: {click.style(cfg.get('memory_limit') or 'unlimited', fg='blue')}")
+        auto_commit_status = "enabled" if ac else "disabled"
+        auto_commit_color = 'green' if ac else 'yellow'
         click.echo(f"  Auto-commit: {click.style(auto_commit_status, fg=auto_commit_color)}")
     except Exception as e:
         click.echo(f"Failed to get status: {e}", err=True)
@@ -247,28 +329,39 @@ def status():
 
 
 @main.command()
-def list():
+@click.option("--json", "as_json", is_flag=True, help="Output containers as JSON")
+@click.pass_context
+def list(ctx, as_json):
     """List all Podman containers and identify the sandbox container."""
-    container = PodmanContainer()
+    container = _get_container(ctx)
 
     try:
+        import itertools
+
         containers = container.list_all_containers()
 
-        if not containers:
+        if as_json:
+            import json
+
+            click.echo(json.dumps([c for c in containers], indent=2))
+            return
+
+        first = next(containers, None)
+        if first is None:
             click.echo(click.style("No containers found.", fg='yellow'))
             return
 
         click.echo(click.style("All Podman containers:", bold=True))
         click.echo("")
 
-        for c in containers:
-            marker = f" {click.style('[SANDBOX]', fg='green', bold=True)}" if c["is_sandbox"] else ""
-            click.echo(f"  {click.style(c['name'], fg='cyan', bold=True)}{marker}")
-            click.echo(f"    Image:   {click.style(c['image'], fg='blue')}")
+        for c in itertools.chain([first], containers):
+            marker = f" {_GREEN_BOLD}[SANDBOX]{_RESET}" if c["is_sandbox"] else ""
+            click.echo(f"  {_CYAN_BOLD}{c['name']}{_RESET}{marker}")
+            click.echo(f"    Image:   {_BLUE}{c['image']}{_RESET}")
 
             # Color status based on state
-            status_color = 'green' if 'running' in c['status'].lower() else 'yellow'
-            click.echo(f"    Status:  {click.style(c['status'], fg=status_color)}")
+            status_color = _GREEN if 'running' in c['status'].lower() else _YELLOW
+            click.echo(f"    Status:  {status_color}{c['status']}{_RESET}")
             click.echo(f"    Created: {c['created']}")
             click.echo("")
 
@@ -278,7 +371,8 @@ def list():
 
 
 @main.command()
-def commit():
+@click.pass_context
+def commit(ctx):
     """Save the current container state to preserve installed packages.
 
     This commits the running container to a local image. When the container
@@ -295,7 +389,7 @@ def commit():
         # Now when you restart, packages are still there
         sandbox stop && sandbox start
     """
-    container = PodmanContainer()
+    container = _get_container(ctx)
 
     try:
         click.echo(click.style("Committing container state...", fg='yellow'))
@@ -313,7 +407,8 @@ def commit():
 
 
 @main.command()
-def reset():
+@click.pass_context
+def reset(ctx):
     """Remove saved container state and revert to base image.
 
     This deletes the committed image, so the next time you start the container
@@ -322,7 +417,7 @@ def reset():
     Examples:
         sandbox reset
     """
-    container = PodmanContainer()
+    container = _get_container(ctx)
 
     try:
         if container.reset():
@@ -339,5 +434,58 @@ def reset():
         sys.exit(1)
 
 
+@main.group()
+def pool():
+    """Manage the warm container pool.
+
+    Warm pool containers are pre-started copies of the sandbox; starting or
+    remounting the sandbox adopts one with a cheap rename instead of paying
+    the full container cold start.
+    """
+    pass
+
+
+@pool.command()
+@click.pass_context
+def warm(ctx):
+    """Pre-create warm sandbox containers for the current directory.
+
+    Examples:
+        sandbox pool warm
+    """
+    container = _get_container(ctx)
+
+    try:
+        created = container.warm_pool()
+        if created:
+            click.echo(click.style(f"✓ Warmed {created} pool container(s)", fg='green', bold=True))
+        else:
+            click.echo(click.style("Pool is already warm", fg='yellow'))
+    except Exception as e:
+        click.echo(f"Failed to warm pool: {e}", err=True)
+        sys.exit(1)
+
+
+@pool.command()
+@click.pass_context
+def drain(ctx):
+    """Remove warm pool containers.
+
+    Examples:
+        sandbox pool drain
+    """
+    container = _get_container(ctx)
+
+    try:
+        removed = container.drain_pool()
+        if removed:
+            click.echo(click.style(f"✓ Removed {removed} pool container(s)", fg='green', bold=True))
+        else:
+            click.echo(click.style("Pool is already empty", fg='yellow'))
+    except Exception as e:
+        click.echo(f"Failed to drain pool: {e}", err=True)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
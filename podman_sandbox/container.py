@@ -1,40 +1,456 @@
 """Container management for podman-sandbox."""
 
+import functools
+import http.client
 import json
 import os
+import select
+import shlex
+import socket
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+# orjson speeds up the config reads/writes on every CLI startup when it
+# happens to be installed, but it is not a dependency of this package —
+# the stdlib fallback is always available.
+try:
+    import orjson
+
+    _config_loads = orjson.loads
+
+    def _config_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _config_loads = json.loads
+
+    def _config_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Keep-alive HTTP connection to the Podman API unix socket."""
+
+    def __init__(self, socket_path: str):
+        super().__init__("localhost")
+        self._socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+_API_BASE = "/v4.0.0/libpod"
+
+# Shared keep-alive connection so repeated queries within one CLI invocation
+# skip both the fork/exec of the podman binary and the TCP-style handshake.
+_api_connection: Optional[_UnixHTTPConnection] = None
+_api_unavailable = False
+# http.client connections can't interleave requests; preflight queries run
+# from worker threads, so serialize access to the shared connection.
+_api_lock = threading.Lock()
+
+
+class _EventWatcher:
+    """Tracks the sandbox container's running state via 'podman events'.
+
+    For long-lived sessions this replaces per-call podman polling with an
+    O(1) read of a flag toggled by the event stream. Only spawned when
+    PODMAN_SANDBOX_WATCH=1, so one-shot CLI invocations don't pay for the
+    extra process.
+    """
+
+    def __init__(self, container_name: str, initially_running: bool):
+        self.running = initially_running
+        self._proc = subprocess.Popen(
+            [
+                *_PODMAN, "events",
+                "--format", "json",
+                "--filter", f"container={container_name}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        thread = threading.Thread(target=self._watch, daemon=True)
+        thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def _watch(self):
+        for line in self._proc.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            status = event.get("Status") or event.get("status")
+            if status == "start":
+                self.running = True
+            elif status in ("died", "stop", "stopped", "remove", "cleanup"):
+                self.running = False
+
+
+def _container_row(c: dict, sandbox_name: str) -> dict:
+    """Normalize one parsed container entry to the row dict the CLI prints."""
+    names = c.get("Names") or ""
+    name = names[0] if isinstance(names, list) else names
+    return {
+        "name": name,
+        "image": c.get("Image", ""),
+        "status": c.get("Status") or c.get("State", ""),
+        "created": c.get("CreatedAt") or str(c.get("Created", "")),
+        "is_sandbox": name == sandbox_name,
+    }
+
+
+# Opt-in transient store (PODMAN_SANDBOX_TRANSIENT=1): keeps container
+# state on tmpfs, sidestepping the BoltDB locking that serializes podman
+# commands under concurrent load. Opt-in only, because the transient store
+# is a separate container table — containers created with it are invisible
+# to plain podman (and to the REST service), so the default stays off.
+_TRANSIENT = os.environ.get("PODMAN_SANDBOX_TRANSIENT") == "1"
+_PODMAN = ("podman", "--transient-store") if _TRANSIENT else ("podman",)
+
+# close_fds=False in the shared kwargs below: fds Python creates are
+# non-inheritable (PEP 446), so nothing leaks across exec anyway, and
+# skipping the fd sweep keeps subprocess on its posix_spawn fast path
+# instead of fork+exec. None of the argvs use Path objects, preexec_fn
+# or shell=True, which would also disqualify it.
+
+# For subprocess calls whose stdout is never read: send it to /dev/null
+# instead of allocating a capture pipe, but keep stderr for error messages
+# (CalledProcessError.stderr).
+_QUIET = dict(stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False)
+
+# Fully silent variant for exit-code probes and best-effort cleanup, where
+# even the error text goes unread: no pipes at all.
+_SILENT = dict(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+
+# Characters that require a shell inside the container (pipes, redirects,
+# variable expansion, globbing, comments, ...). Plain quoting is handled
+# client-side by shlex.
+_SHELL_METACHARS = set(";|&$`<>*?~(){}[]#\n")
+
+# Commands whose leading word only means something to a shell — they have
+# no executable to exec directly.
+_SHELL_BUILTINS = {
+    "cd", "export", "unset", "set", "source", ".", "exec", "exit",
+    "read", "alias", "wait", "trap", "umask", "ulimit", "eval",
+    "command", "type",
+}
+
+
+def _exec_argv(command: str) -> list:
+    """Build the in-container argv for a command string.
+
+    Simple commands are split client-side with shlex so podman exec runs
+    them directly, skipping one sh fork per execution inside the container.
+    Anything needing shell semantics still goes through sh -c — including
+    'VAR=1 cmd' environment prefixes and bare builtins, which have no
+    binary to exec.
+    """
+    if not _SHELL_METACHARS.intersection(command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            argv = None
+        if argv and "=" not in argv[0] and argv[0] not in _SHELL_BUILTINS:
+            return argv
+    return ["sh", "-c", command]
+
+
+@functools.lru_cache(maxsize=None)
+def _selinux_enforcing() -> bool:
+    """Whether SELinux is enforcing on this host (probed once per process)."""
+    try:
+        with open("/sys/fs/selinux/enforce", "rb") as f:
+            return f.read(1) == b"1"
+    except OSError:
+        return False
+
+
+def _same_image(name: str, image: str) -> bool:
+    """Whether an image name from inspect refers to the requested image.
+
+    Inspect reports fully qualified names (docker.io/library/alpine:latest)
+    while the config stores short ones, so an exact compare never matches
+    the default setup; fall back to matching on the registry-path suffix.
+    """
+    return name == image or name.endswith("/" + image)
+
+
+def _memory_bytes(limit: str) -> Optional[int]:
+    """Parse a podman-style memory limit ('512m', '1g') to bytes.
+
+    Returns None when the string isn't something this parser understands;
+    callers treat that as "can't compare, don't assume equal".
+    """
+    units = {"b": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+    s = limit.strip().lower()
+    try:
+        if s and s[-1] in units:
+            return int(float(s[:-1]) * units[s[-1]])
+        return int(s)
+    except ValueError:
+        return None
+
+
+def _same_directory(path_a: str, path_b: str) -> bool:
+    """Whether two paths refer to the same directory.
+
+    A plain string compare treats '/foo' vs '/foo/' or a symlinked path as
+    different and triggers a pointless container restart; comparing the
+    underlying inodes avoids that.
+    """
+    if path_a == path_b:
+        return True
+    try:
+        return os.path.samefile(path_a, path_b)
+    except OSError:
+        return False
+
+
+def _event_confirms_kill(line: bytes, threshold: float) -> bool:
+    """Whether a podman events line is a death recent enough to count.
+
+    The --since replay window stop() subscribes with can resurface the
+    died event of a previous same-named container (e.g. the rm -f of an
+    execute remount moments earlier); only an event stamped at or after
+    the kill confirms the current death. Unparseable JSON is skipped,
+    but an event missing its timestamp fields counts as confirmation —
+    better a spurious early return than sitting out the full timeout on
+    a format change.
+    """
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return False
+    nano = event.get("timeNano")
+    if isinstance(nano, int):
+        return nano / 1e9 >= threshold
+    seconds = event.get("time")
+    if isinstance(seconds, (int, float)) and not isinstance(seconds, bool):
+        return float(seconds) >= threshold
+    return True
+
+
+def _api_socket_path() -> Optional[str]:
+    """Return a rootless Podman API socket path, or None if unavailable.
+
+    The standard socket is systemd socket-activated on most setups, so if
+    it isn't there yet one quiet 'systemctl --user start podman.socket' is
+    attempted. Failing that (no systemd), a private short-lived
+    'podman system service' is spawned for this session — it idles out on
+    its own, and its socket is reused while it lives. Only when that also
+    fails do callers drop to the podman CLI per query.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    path = os.path.join(runtime_dir, "podman", "podman.sock")
+    if os.path.exists(path):
+        return path
+    try:
+        subprocess.run(
+            ["systemctl", "--user", "start", "podman.socket"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            timeout=3,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        pass  # no systemd here; try running the service ourselves
+    if os.path.exists(path):
+        return path
+
+    own = os.path.join(runtime_dir, "podman-sandbox.sock")
+    if os.path.exists(own):
+        return own
+    try:
+        subprocess.Popen(
+            [*_PODMAN, "system", "service", "--time=60", f"unix://{own}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return None
+    # The service needs a moment to bind; don't stall the CLI for long —
+    # this invocation can still fall back to the podman CLI and the next
+    # one finds the socket ready.
+    deadline = time.monotonic() + 1.0
+    while not os.path.exists(own):
+        if time.monotonic() > deadline:
+            return None
+        time.sleep(0.01)
+    return own
+
+
+def _api_get(path: str):
+    """GET a libpod REST API path over the shared unix-socket connection.
+
+    Returns an (http_status, decoded_json) tuple, or None when the API socket
+    is unavailable — callers fall back to the podman CLI in that case. After
+    the first transport failure the API is not retried for this process.
+    """
+    global _api_connection, _api_unavailable
+    # The transient store keeps its own container table, which the REST
+    # service (running against the default store) cannot see — CLI only.
+    if _api_unavailable or _TRANSIENT:
+        return None
+    with _api_lock:
+        if _api_connection is None:
+            socket_path = _api_socket_path()
+            if socket_path is None:
+                _api_unavailable = True
+                return None
+            _api_connection = _UnixHTTPConnection(socket_path)
+        try:
+            _api_connection.request("GET", _API_BASE + path)
+            response = _api_connection.getresponse()
+            body = response.read()
+            return response.status, json.loads(body) if body else None
+        except (OSError, http.client.HTTPException, ValueError):
+            _api_unavailable = True
+            _api_connection = None
+            return None
+
+
+# Plain-string config paths computed once at import; the Path equivalents
+# below exist for the public API, but the hot paths use these directly to
+# avoid rebuilding Path objects per call.
+_CONFIG_DIR_STR = os.path.expanduser("~/.config/podman-sandbox")
+_CONFIG_FILE_STR = _CONFIG_DIR_STR + "/config.json"
+_IMAGE_CACHE_STR = _CONFIG_DIR_STR + "/image_cache.json"
+# Written by warm_pool(), removed by drain_pool(): its presence is what
+# lets start/execute skip the pool member inspects entirely when the
+# opt-in pool was never warmed.
+_POOL_MARKER_STR = _CONFIG_DIR_STR + "/pool_warmed"
+_HOME = os.path.dirname(os.path.dirname(_CONFIG_DIR_STR))
+
 
 class PodmanContainer:
     """Manages the podman sandbox container lifecycle."""
 
-    CONFIG_DIR = Path.home() / ".config" / "podman-sandbox"
-    CONFIG_FILE = CONFIG_DIR / "config.json"
     CONTAINER_NAME = "podman-sandbox"
     DEFAULT_IMAGE = "alpine:latest"
     COMMITTED_IMAGE = "localhost/podman-sandbox:committed"
 
+    # Fixed podman argvs built once at class definition; subprocess takes
+    # tuples directly, so the hot paths skip rebuilding these lists per call.
+    _CMD_STOP = (*_PODMAN, "stop", CONTAINER_NAME)
+    _CMD_RM_F = (*_PODMAN, "rm", "-f", CONTAINER_NAME)
+    _CMD_EXISTS = (*_PODMAN, "container", "exists", CONTAINER_NAME)
+    _CMD_IMAGES = (*_PODMAN, "images", "--format", "{{.Repository}}:{{.Tag}}")
+    _CMD_PS_ALL_JSON = (*_PODMAN, "ps", "-a", "--format", "{{json .}}")
+    _CMD_COMMIT = (*_PODMAN, "commit", CONTAINER_NAME, COMMITTED_IMAGE)
+    _CMD_RMI_F = (*_PODMAN, "rmi", "-f", COMMITTED_IMAGE)
+    _CMD_RMI = (*_PODMAN, "rmi", COMMITTED_IMAGE)
+    _CMD_PS_ANCESTOR = (
+        *_PODMAN, "ps", "-a",
+        "--filter", f"ancestor={COMMITTED_IMAGE}",
+        "--format", "{{.Names}}",
+    )
+
+    # Warm pool: pre-created sleep-infinity containers that start()/execute
+    # can adopt with a cheap rename instead of paying podman run cold start.
+    POOL_PREFIX = "podman-sandbox-pool-"
+    POOL_SIZE = 2
+
+    # Parsed config shared across instances, keyed on the file's mtime so a
+    # rewrite by another process invalidates it: path -> (mtime_ns, config).
+    _CONFIG_CACHE = {}
+
+    # How long a cached inspect result stays valid. Short enough that stale
+    # state can't outlive a human-scale command, long enough to absorb the
+    # repeated polls within one CLI invocation.
+    STATE_CACHE_TTL = 0.3
+
     def __init__(self):
         self.config = self._load_config()
+        # getcwd is a syscall and can't change mid-command; fetch it once.
+        self._cwd = os.getcwd()
+        self._state_cache = None  # (monotonic timestamp, inspect dict)
+        self._event_watcher = None
+        if os.environ.get("PODMAN_SANDBOX_WATCH") == "1":
+            try:
+                self._event_watcher = _EventWatcher(
+                    self.CONTAINER_NAME, self._inspect_uncached()["running"]
+                )
+            except OSError:
+                self._event_watcher = None
+
+    @functools.cached_property
+    def CONFIG_DIR(self) -> Path:
+        """Config directory as a Path, built on first access.
+
+        The internal paths are plain strings; these Path forms exist for
+        callers and are deliberately lazy so importing the module doesn't
+        construct Path objects nobody may use.
+        """
+        return Path(_CONFIG_DIR_STR)
+
+    @functools.cached_property
+    def CONFIG_FILE(self) -> Path:
+        """Config file as a Path, built on first access."""
+        return Path(_CONFIG_FILE_STR)
+
+    def _invalidate_state_cache(self):
+        """Drop the cached inspect result after a state-changing operation."""
+        self._state_cache = None
 
     def _load_config(self) -> dict:
         """Load configuration from file."""
-        if self.CONFIG_FILE.exists():
-            with open(self.CONFIG_FILE, "r") as f:
-                return json.load(f)
-        return {
-            "memory_limit": None,
-            "image": self.DEFAULT_IMAGE,
-            "auto_commit": False,
-        }
+        try:
+            mtime_ns = os.stat(_CONFIG_FILE_STR).st_mtime_ns
+        except FileNotFoundError:
+            return {
+                "memory_limit": None,
+                "image": self.DEFAULT_IMAGE,
+                "auto_commit": False,
+            }
+
+        cached = self._CONFIG_CACHE.get(_CONFIG_FILE_STR)
+        if cached is not None and cached[0] == mtime_ns:
+            # Hand out a copy so configure() can't mutate the cache in place
+            return dict(cached[1])
+
+        # Read raw bytes and let json.loads handle decoding — skips the
+        # TextIOWrapper layer on a file read every command pays for.
+        with open(_CONFIG_FILE_STR, "rb") as f:
+            config = _config_loads(f.read())
+        self._CONFIG_CACHE[_CONFIG_FILE_STR] = (mtime_ns, dict(config))
+        return config
 
     def _save_config(self):
-        """Save configuration to file."""
-        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self.CONFIG_FILE, "w") as f:
-            json.dump(self.config, f, indent=2)
+        """Save configuration to file.
+
+        Writes to a temp file and renames it into place so a concurrent
+        reader never sees a truncated config. A write producing byte-for-
+        byte identical content is skipped entirely — configure() calls
+        that change nothing shouldn't touch the disk.
+        """
+        data = _config_dumps(self.config)
+        try:
+            with open(_CONFIG_FILE_STR, "rb") as f:
+                if f.read() == data:
+                    return
+        except OSError:
+            pass
+
+        os.makedirs(_CONFIG_DIR_STR, exist_ok=True)
+        tmp = _CONFIG_FILE_STR + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, _CONFIG_FILE_STR)
+        self._CONFIG_CACHE[_CONFIG_FILE_STR] = (
+            os.stat(_CONFIG_FILE_STR).st_mtime_ns,
+            dict(self.config),
+        )
 
     def configure(self, memory_limit: Optional[str] = None, image: Optional[str] = None, auto_commit: Optional[bool] = None):
         """Configure container settings."""
@@ -46,83 +462,254 @@ class PodmanContainer:
             self.config["auto_commit"] = auto_commit
         self._save_config()
 
-    def is_running(self) -> bool:
-        """Check if the sandbox container is running."""
+    _NOT_CREATED = {
+        "exists": False,
+        "running": False,
+        "mounted_dir": None,
+        "status": None,
+        "started_at": None,
+        "memory_limit": None,
+        "image": None,
+    }
+
+    def inspect(self) -> dict:
+        """Fetch the container's state in a single inspect call.
+
+        Returns a dict with 'exists', 'running', 'mounted_dir' (the host path
+        mounted at /workspace), 'status', 'started_at', and 'memory_limit',
+        so every read-only accessor shares one podman round-trip. Results are
+        memoized for STATE_CACHE_TTL seconds and invalidated by any
+        state-changing method, so back-to-back polls within one command hit
+        podman at most once.
+        """
+        now = time.monotonic()
+        if self._state_cache is not None and now - self._state_cache[0] < self.STATE_CACHE_TTL:
+            return self._state_cache[1]
+        info = self._inspect_uncached()
+        self._state_cache = (now, info)
+        return info
+
+    def _inspect_uncached(self) -> dict:
+        """Fetch inspect data from podman, bypassing the state cache."""
+        info = self._inspect_container(self.CONTAINER_NAME)
+        if info is None:
+            return dict(self._NOT_CREATED)
+        return info
+
+    def _inspect_container(self, name: str) -> Optional[dict]:
+        """Inspect an arbitrary container, or return None if it doesn't exist."""
+        reply = _api_get(f"/containers/{name}/json")
+        if reply is not None:
+            http_status, data = reply
+            if http_status != 200 or not isinstance(data, dict):
+                return None
+            return self._parse_inspect(data)
+
         try:
             result = subprocess.run(
-                ["podman", "ps", "--filter", f"name={self.CONTAINER_NAME}", "--format", "{{.Names}}"],
+                [*_PODMAN, "inspect", name, "--format", "{{json .}}"],
                 capture_output=True,
+                close_fds=False,
                 text=True,
                 check=True,
             )
-            return self.CONTAINER_NAME in result.stdout
-        except subprocess.CalledProcessError:
-            return False
+            return self._parse_inspect(json.loads(result.stdout))
+        except (subprocess.CalledProcessError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _parse_inspect(data: dict) -> dict:
+        """Reduce raw inspect JSON to the fields the accessors need."""
+        mounted_dir = None
+        for mount in data.get("Mounts", []):
+            if mount.get("Destination") == "/workspace":
+                mounted_dir = mount.get("Source")
+                break
+        state = data.get("State", {})
+        memory = data.get("HostConfig", {}).get("Memory", 0)
+        return {
+            "exists": True,
+            "running": state.get("Running", False),
+            "mounted_dir": mounted_dir,
+            "status": state.get("Status", ""),
+            "started_at": state.get("StartedAt", ""),
+            "memory_limit": str(memory) if memory else "unlimited",
+            "image": data.get("ImageName") or data.get("Config", {}).get("Image", ""),
+        }
+
+    def is_running(self) -> bool:
+        """Check if the sandbox container is running."""
+        watcher = self._event_watcher
+        if watcher is not None and watcher.alive:
+            return watcher.running
+        return self.inspect()["running"]
 
     def exists(self) -> bool:
         """Check if the sandbox container exists (running or stopped)."""
+        # Reuse a fresh inspect result if one is cached; otherwise prefer the
+        # cheap existence probe over a full inspect.
+        now = time.monotonic()
+        if self._state_cache is not None and now - self._state_cache[0] < self.STATE_CACHE_TTL:
+            return self._state_cache[1]["exists"]
+
+        # The dedicated existence endpoint is a plain name lookup — much
+        # cheaper than inspecting or rendering the full ps table.
+        reply = _api_get(f"/containers/{self.CONTAINER_NAME}/exists")
+        if reply is not None:
+            http_status, _ = reply
+            return http_status == 204
+
+        result = subprocess.run(self._CMD_EXISTS, **_SILENT, check=False)
+        return result.returncode == 0
+
+    def get_mounted_directory(self) -> Optional[str]:
+        """Get the mounted directory in the container, if any.
+
+        A stopped container keeps its mount configuration, and that answer
+        is just as valid — callers that care about liveness check
+        is_running() themselves, so there's no reason to gate on it here.
+        """
+        return self.inspect()["mounted_dir"]
+
+    @functools.cached_property
+    def _local_images(self) -> set:
+        """Names of locally present images, listed once per process.
+
+        Acts as a positive cache: a hit skips the podman fork entirely,
+        while a miss still falls through to 'podman image exists'.
+        """
+        names = set()
+        reply = _api_get("/images/json")
+        if reply is not None:
+            http_status, data = reply
+            if http_status == 200 and isinstance(data, list):
+                for img in data:
+                    names.update(img.get("Names") or [])
+            return names
+
         try:
             result = subprocess.run(
-                ["podman", "ps", "-a", "--filter", f"name={self.CONTAINER_NAME}", "--format", "{{.Names}}"],
+                self._CMD_IMAGES,
                 capture_output=True,
+                close_fds=False,
                 text=True,
                 check=True,
             )
-            return self.CONTAINER_NAME in result.stdout
         except subprocess.CalledProcessError:
-            return False
+            return names
+        names.update(line for line in result.stdout.splitlines() if line)
+        return names
 
-    def get_mounted_directory(self) -> Optional[str]:
-        """Get the currently mounted directory in the container."""
-        if not self.is_running():
-            return None
+    @functools.cached_property
+    def _known_images(self) -> set:
+        """Images recorded as present by earlier CLI invocations.
 
+        Images don't vanish on their own, so a positive answer persisted on
+        disk lets the common start/execute path skip the image probe fork
+        entirely. The rmi paths (commit/reset) drop their entries.
+        """
         try:
-            result = subprocess.run(
-                [
-                    "podman", "inspect", self.CONTAINER_NAME,
-                    "--format", "{{range .Mounts}}{{if eq .Destination \"/workspace\"}}{{.Source}}{{end}}{{end}}"
-                ],
-                capture_output=True,
-                text=True,
+            with open(_IMAGE_CACHE_STR, "rb") as f:
+                return set(_config_loads(f.read()))
+        except (OSError, ValueError):
+            return set()
+
+    def _remember_image(self, image: str):
+        """Record an image as locally present, persisting across invocations."""
+        if image in self._known_images:
+            return
+        self._known_images.add(image)
+        self._write_image_cache()
+
+    def _forget_image(self, image: str):
+        """Drop an image from the persistent cache (after rmi)."""
+        if image not in self._known_images:
+            return
+        self._known_images.discard(image)
+        self._write_image_cache()
+
+    def _evict_image(self, image: str):
+        """Drop an image from both the per-process and the persistent cache.
+
+        For when a cached "present" answer turns out to be stale: the image
+        was removed behind our back (podman rmi, system prune). The listing
+        cache stores fully qualified names, so matching entries go too.
+        """
+        self._local_images.difference_update(
+            {n for n in self._local_images if _same_image(n, image)}
+        )
+        self._local_images.discard(image)
+        self._forget_image(image)
+
+    def _write_image_cache(self):
+        os.makedirs(_CONFIG_DIR_STR, exist_ok=True)
+        tmp = _IMAGE_CACHE_STR + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_config_dumps(sorted(self._known_images)))
+        os.replace(tmp, _IMAGE_CACHE_STR)
+
+    def _image_present(self, image: str) -> bool:
+        """Check if an image exists locally (no pull)."""
+        # Disk cache first: a hit answers without forking podman at all
+        if image in self._known_images:
+            return True
+
+        images = self._local_images
+        # Stored names are fully qualified; match short names by suffix
+        if image in images or any(_same_image(n, image) for n in images):
+            self._remember_image(image)
+            return True
+
+        result = subprocess.run(
+            [*_PODMAN, "image", "exists", image],
+            **_SILENT,
+            check=False,
+        )
+        if result.returncode == 0:
+            images.add(image)
+            self._remember_image(image)
+            return True
+        return False
+
+    def _pull_image(self, image: str) -> bool:
+        """Pull an image from its registry."""
+        try:
+            subprocess.run(
+                [*_PODMAN, "pull", image],
+                **_QUIET,
                 check=True,
             )
-            return result.stdout.strip() or None
+            self._local_images.add(image)
+            self._remember_image(image)
+            return True
         except subprocess.CalledProcessError:
-            return None
+            return False
 
     def _ensure_image_exists(self, image: str) -> bool:
         """Check if image exists locally, pull if not."""
-        try:
-            result = subprocess.run(
-                ["podman", "image", "exists", image],
-                capture_output=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                return True  # Image exists, no pull needed
+        if self._image_present(image):
+            return True
+        return self._pull_image(image)
 
-            # Image doesn't exist, pull it
+    def _rm_if_exists(self):
+        """Force-remove the sandbox container if present (kill + rm in one)."""
+        if self.exists():
             subprocess.run(
-                ["podman", "pull", image],
-                capture_output=True,
+                self._CMD_RM_F,
+                **_QUIET,
                 check=True,
             )
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            self._invalidate_state_cache()
 
     def _committed_image_exists(self) -> bool:
-        """Check if a committed image exists."""
-        try:
-            result = subprocess.run(
-                ["podman", "image", "exists", self.COMMITTED_IMAGE],
-                capture_output=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except subprocess.CalledProcessError:
-            return False
+        """Check if a committed image exists.
+
+        Goes through the shared image caches, so a start that checks both
+        the committed and the configured image costs at most one listing —
+        and usually no podman call at all. Safe because the rmi paths in
+        commit()/reset() evict the entry.
+        """
+        return self._image_present(self.COMMITTED_IMAGE)
 
     def _get_image_to_use(self) -> str:
         """Determine which image to use: committed if it exists, otherwise base image."""
@@ -130,18 +717,178 @@ class PodmanContainer:
             return self.COMMITTED_IMAGE
         return self.config["image"]
 
-    def start(self, force_restart: bool = False):
+    def _build_run_cmd(self, name: str, directory: str) -> list:
+        """Build the podman run argv for a sandbox-style container."""
+        volume = f"{directory}:/workspace"
+        if _selinux_enforcing() and os.environ.get("PODMAN_SANDBOX_NO_RELABEL") != "1":
+            # Shared label (:z): one relabel is reused across remounts of the
+            # same tree, where :Z would recursively re-chcon every file each
+            # time execute restarts the container after a cd.
+            volume += ":z"
+        cmd = [
+            *_PODMAN, "run",
+            "-d",  # Detached mode
+            "--name", name,
+            "-v", volume,  # Mount directory (rootless-friendly)
+            "-w", "/workspace",  # Set working directory
+        ]
+        if self.config.get("memory_limit"):
+            cmd.extend(["-m", self.config["memory_limit"]])
+        cmd.extend([self._get_image_to_use(), "sleep", "infinity"])
+        return cmd
+
+    def _run_sandbox_container(self, name: str, directory: str):
+        """podman run with self-healing for a stale image cache.
+
+        The persistent cache assumes images don't vanish on their own, but
+        they can (podman rmi, system prune, system reset), and then the run
+        fails on a "present" image until someone deletes the cache file by
+        hand. On failure, evict both candidate images, re-resolve through
+        the real exists/pull path and retry once; a second failure is a
+        genuine error.
+        """
+        try:
+            subprocess.run(
+                self._build_run_cmd(name, directory),
+                **_QUIET,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            self._evict_image(self.COMMITTED_IMAGE)
+            self._evict_image(self.config["image"])
+            if not self._ensure_image_exists(self._get_image_to_use()):
+                raise
+            subprocess.run(
+                self._build_run_cmd(name, directory),
+                **_QUIET,
+                check=True,
+            )
+        self._invalidate_state_cache()
+
+    def _pool_names(self) -> list:
+        return [f"{self.POOL_PREFIX}{i}" for i in range(self.POOL_SIZE)]
+
+    def warm_pool(self, directory: Optional[str] = None) -> int:
+        """Pre-create warm pool containers mounted at the given directory.
+
+        Returns the number of members created. start() and the execute
+        restart path adopt a matching member with a cheap rename instead of
+        paying the full podman run cold start.
+        """
+        directory = directory or self._cwd
+        self._ensure_image_exists(self.config["image"])
+        created = 0
+        for name in self._pool_names():
+            if self._inspect_container(name) is not None:
+                continue
+            subprocess.run(
+                self._build_run_cmd(name, directory),
+                **_QUIET,
+                check=True,
+            )
+            created += 1
+        os.makedirs(_CONFIG_DIR_STR, exist_ok=True)
+        with open(_POOL_MARKER_STR, "w"):
+            pass
+        return created
+
+    def drain_pool(self) -> int:
+        """Remove all warm pool containers and clear the warmed marker.
+
+        The counterpart to warm_pool(): without it the pool self-replenishes
+        on every adoption and its members linger forever. Returns the number
+        of members removed.
+        """
+        names = [n for n in self._pool_names() if self._inspect_container(n) is not None]
+        if names:
+            subprocess.run(
+                [*_PODMAN, "rm", "-f", *names],
+                **_QUIET,
+                check=True,
+            )
+        try:
+            os.unlink(_POOL_MARKER_STR)
+        except OSError:
+            pass
+        return len(names)
+
+    def _adopt_pool_member(self, directory: str) -> bool:
+        """Rename a warm pool container into place as the sandbox.
+
+        Only a running member with the right image, the requested directory
+        mounted and the configured memory limit qualifies. On success a
+        replacement member is spawned in the background so the pool stays
+        warm.
+        """
+        # The pool is opt-in; without the marker warm_pool() leaves behind
+        # there is nothing to adopt, and the member inspects (two podman
+        # forks on the CLI fallback) would be pure overhead on every start.
+        if not os.path.exists(_POOL_MARKER_STR):
+            return False
+        image = self._get_image_to_use()
+        memory = self.config.get("memory_limit")
+        if memory:
+            wanted_memory = _memory_bytes(memory)
+            if wanted_memory is None:
+                # Can't verify a member carries this limit; let podman run
+                # apply it instead of adopting blind
+                return False
+        else:
+            wanted_memory = None
+        for name in self._pool_names():
+            info = self._inspect_container(name)
+            if info is None or not info["running"]:
+                continue
+            if not _same_image(info["image"], image):
+                continue
+            member_memory = info["memory_limit"]
+            member_memory = None if member_memory == "unlimited" else int(member_memory)
+            if member_memory != wanted_memory:
+                continue
+            if not info["mounted_dir"] or not _same_directory(info["mounted_dir"], directory):
+                continue
+            result = subprocess.run(
+                [*_PODMAN, "container", "rename", name, self.CONTAINER_NAME],
+                **_SILENT,
+                check=False,
+            )
+            if result.returncode == 0:
+                self._invalidate_state_cache()
+                # Fire-and-forget replacement; the pool refills off-path
+                subprocess.Popen(
+                    self._build_run_cmd(name, directory),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                return True
+        return False
+
+    def start(self, force_restart: bool = False) -> bool:
         """Start the sandbox container.
 
         Args:
             force_restart: If True, restart even if already running with different directory
+
+        Returns:
+            True once the container is running — callers don't need to
+            re-query podman to confirm.
         """
-        current_dir = os.getcwd()
+        current_dir = self._cwd
+        image = self.config["image"]
+
+        # The state inspect and the image probe are independent read-only
+        # queries; run them concurrently so the preflight costs one podman
+        # round-trip instead of two.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            state = pool.submit(self.inspect)
+            image_probe = pool.submit(self._image_present, image)
+            info = state.result()
+            image_present = image_probe.result()
 
         # Check if container is running with a different directory
-        if self.is_running():
-            mounted_dir = self.get_mounted_directory()
-            if mounted_dir and mounted_dir != current_dir:
+        if info["running"]:
+            mounted_dir = info["mounted_dir"]
+            if mounted_dir and not _same_directory(mounted_dir, current_dir):
                 if not force_restart:
                     raise RuntimeError(
                         f"Container '{self.CONTAINER_NAME}' is already running with a different directory.\n"
@@ -150,39 +897,29 @@ class PodmanContainer:
                         f"Run 'podman-sandbox stop && podman-sandbox start' to remount with current directory."
                     )
                 # Fall through to restart with new directory
-            elif mounted_dir == current_dir:
+            elif mounted_dir:
                 raise RuntimeError(f"Container '{self.CONTAINER_NAME}' is already running")
 
-        # Ensure image exists (only pulls if not present)
-        self._ensure_image_exists(self.config["image"])
-
-        # Fast remove if exists (podman rm -f is faster than stop + rm)
-        if self.exists():
-            subprocess.run(
-                ["podman", "rm", "-f", self.CONTAINER_NAME],
-                capture_output=True,
-                check=True,
-            )
-
-        # Build podman run command
-        cmd = [
-            "podman", "run",
-            "-d",  # Detached mode
-            "--name", self.CONTAINER_NAME,
-            "-v", f"{current_dir}:/workspace",  # Mount current directory (rootless-friendly)
-            "-w", "/workspace",  # Set working directory
-        ]
-
-        # Add memory limit if configured
-        if self.config.get("memory_limit"):
-            cmd.extend(["-m", self.config["memory_limit"]])
+        # Ensure image exists; when a pull is needed, overlap the
+        # network-bound download with the local stale-container removal.
+        # The pull runs as a plain non-blocking Popen — no worker thread
+        # needed just to sit in waitpid.
+        if image_present:
+            self._rm_if_exists()
+        else:
+            pull = subprocess.Popen([*_PODMAN, "pull", image], **_SILENT)
+            self._rm_if_exists()
+            if pull.wait() == 0:
+                self._local_images.add(image)
+                self._remember_image(image)
 
-        # Use committed image if it exists, otherwise use configured image
-        image_to_use = self._get_image_to_use()
-        cmd.extend([image_to_use, "sleep", "infinity"])
+        # A warm pool member with the right mount is a rename away
+        if self._adopt_pool_member(current_dir):
+            return True
 
         # Start container
-        subprocess.run(cmd, capture_output=True, check=True)
+        self._run_sandbox_container(self.CONTAINER_NAME, current_dir)
+        return True
 
     def stop(self, skip_commit: bool = False):
         """Stop the sandbox container.
@@ -203,23 +940,134 @@ class PodmanContainer:
                 # Don't fail stop if commit fails, just skip it
                 pass
 
-        subprocess.run(
-            ["podman", "stop", self.CONTAINER_NAME],
-            capture_output=True,
-            check=True,
+        # The sandbox's pid1 is 'sleep infinity', which has no graceful
+        # shutdown to wait for, so deliver SIGKILL directly and watch the
+        # libpod event stream for the death notification instead of letting
+        # 'podman stop' sit out its grace period polling the runtime.
+        # --since a few seconds back: Popen returns before the events
+        # process has actually subscribed, so a death that lands in that
+        # window would otherwise be lost and cost the full select timeout.
+        # Replayed history makes the race harmless.
+        events = subprocess.Popen(
+            [
+                *_PODMAN, "events",
+                "--since", "5s",
+                "--filter", f"container={self.CONTAINER_NAME}",
+                "--filter", "event=died",
+                "--format", "json",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
+        try:
+            kill_time = time.time()
+            result = subprocess.run(
+                [*_PODMAN, "kill", "--signal", "KILL", self.CONTAINER_NAME],
+                **_SILENT,
+                check=False,
+            )
+            if result.returncode == 0:
+                # Read until an event stamped at or after the kill — the
+                # replay that makes the subscribe race harmless can also
+                # resurface a stale death of a previous same-named
+                # container, which must not count. The one-second slack
+                # covers events carrying only seconds resolution; the
+                # deadline guards against a lost event.
+                deadline = time.monotonic() + 10
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if not select.select([events.stdout], [], [], remaining)[0]:
+                        break
+                    line = events.stdout.readline()
+                    if not line:
+                        break
+                    if _event_confirms_kill(line, kill_time - 1.0):
+                        break
+            else:
+                # kill races a container that exited on its own; plain stop
+                # is the safe catch-all
+                subprocess.run(self._CMD_STOP, **_QUIET, check=True)
+        finally:
+            events.kill()
+            events.wait()
+        self._invalidate_state_cache()
 
         return committed
 
-    def execute(self, command: str, interactive: bool = False, auto_restart: bool = True) -> subprocess.CompletedProcess:
+    def _build_exec_cmd(self, command: str, interactive: bool) -> list:
+        """Build the full podman exec argv for a command."""
+        cmd = [*_PODMAN, "exec"]
+        if interactive:
+            # Interactive sessions keep the shell wrapper (job control, PATH
+            # lookup of the requested shell, etc.)
+            cmd.extend(["-it", self.CONTAINER_NAME, "sh", "-c", command])
+        else:
+            cmd.append(self.CONTAINER_NAME)
+            cmd.extend(_exec_argv(command))
+        return cmd
+
+    def exec_replace(self, command: str, interactive: bool = False):
+        """Replace the current process with podman exec.
+
+        Does not return on success; the podman process inherits our stdio
+        and exit status propagation is implicit.
+        """
+        argv = self._build_exec_cmd(command, interactive)
+        os.execvp("podman", argv)
+
+    def restart(self) -> str:
+        """Apply the current config to the container as cheaply as possible.
+
+        Diffs the config against the container's actual state: when only the
+        memory limit changed, a live 'podman update' suffices (cgroup v2
+        applies it without a restart); anything else falls back to the full
+        remove + run. Auto-commit is intentionally skipped, as for any other
+        config-driven restart.
+
+        Returns 'updated', 'recreated', or 'started' (wasn't running).
+        """
+        info = self.inspect()
+        current_dir = self._cwd
+
+        if not info["running"]:
+            self.start()
+            return "started"
+
+        mount_ok = info["mounted_dir"] and _same_directory(info["mounted_dir"], current_dir)
+        image_ok = _same_image(info["image"], self._get_image_to_use())
+        memory = self.config.get("memory_limit")
+        if mount_ok and image_ok and memory:
+            result = subprocess.run(
+                [*_PODMAN, "update", "--memory", memory, self.CONTAINER_NAME],
+                **_SILENT,
+                check=False,
+            )
+            if result.returncode == 0:
+                self._invalidate_state_cache()
+                return "updated"
+            # podman too old for update, or the limit was rejected — recreate
+
+        self._rm_if_exists()
+        self.start()
+        return "recreated"
+
+    def execute(self, command: str, interactive: bool = False, auto_restart: bool = True, verify: bool = True) -> subprocess.CompletedProcess:
         """Execute a command in the sandbox container.
 
         Args:
             command: The command to execute
             interactive: Run in interactive mode
             auto_restart: Automatically restart container if directory changed
+            verify: Check the container is running (and remount if the
+                directory changed) before executing. Skipping this avoids the
+                inspect round-trip when the caller knows the sandbox is up.
         """
-        current_dir = os.getcwd()
+        if not verify:
+            return subprocess.run(self._build_exec_cmd(command, interactive), check=False)
+
+        current_dir = self._cwd
 
         if not self.is_running():
             raise RuntimeError(
@@ -228,103 +1076,68 @@ class PodmanContainer:
 
         # Check if the mounted directory matches current directory
         mounted_dir = self.get_mounted_directory()
-        if mounted_dir and mounted_dir != current_dir and auto_restart:
-            # Fast restart: rm -f (kill+remove) then run
-            self._ensure_image_exists(self.config["image"])
-
-            # Fast remove (kills and removes in one operation)
-            subprocess.run(
-                ["podman", "rm", "-f", self.CONTAINER_NAME],
-                capture_output=True,
-                check=True,
-            )
+        if mounted_dir and not _same_directory(mounted_dir, current_dir) and auto_restart:
+            # Fast restart: the image check (network in the worst case) and
+            # the rm -f of the stale container are independent, so overlap
+            # them the same way start() overlaps pull and rm.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                image_check = pool.submit(self._ensure_image_exists, self.config["image"])
+                pool.submit(
+                    subprocess.run, self._CMD_RM_F, **_QUIET, check=True
+                ).result()
+                image_check.result()
 
-            restart_cmd = [
-                "podman", "run",
-                "-d",
-                "--name", self.CONTAINER_NAME,
-                "-v", f"{current_dir}:/workspace",
-                "-w", "/workspace",
-            ]
+            if not self._adopt_pool_member(current_dir):
+                self._run_sandbox_container(self.CONTAINER_NAME, current_dir)
 
-            if self.config.get("memory_limit"):
-                restart_cmd.extend(["-m", self.config["memory_limit"]])
-
-            image_to_use = self._get_image_to_use()
-            restart_cmd.extend([image_to_use, "sleep", "infinity"])
-
-            subprocess.run(restart_cmd, capture_output=True, check=True)
-
-        cmd = ["podman", "exec"]
-
-        if interactive:
-            cmd.append("-it")
-
-        cmd.extend([self.CONTAINER_NAME, "sh", "-c", command])
-
-        return subprocess.run(cmd, check=False)
+        return subprocess.run(self._build_exec_cmd(command, interactive), check=False)
 
     def status(self) -> dict:
         """Get container status information."""
-        if not self.exists():
+        info = self.inspect()
+        if not info["exists"]:
             return {"status": "not_created", "running": False}
+        if info["running"]:
+            return {
+                "status": info["status"],
+                "running": True,
+                "started_at": info["started_at"],
+                "memory_limit": info["memory_limit"],
+            }
+        return {"status": "stopped", "running": False}
 
-        if self.is_running():
-            # Get container stats
-            try:
-                result = subprocess.run(
-                    [
-                        "podman", "inspect", self.CONTAINER_NAME,
-                        "--format", "{{.State.Status}}|{{.State.StartedAt}}|{{.HostConfig.Memory}}"
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                status, started_at, memory = result.stdout.strip().split("|")
-                return {
-                    "status": status,
-                    "running": True,
-                    "started_at": started_at,
-                    "memory_limit": memory if memory != "0" else "unlimited",
-                }
-            except subprocess.CalledProcessError:
-                return {"status": "error", "running": False}
-        else:
-            return {"status": "stopped", "running": False}
+    def list_all_containers(self):
+        """Yield all containers and indicate which is the sandbox.
 
-    def list_all_containers(self) -> list:
-        """List all containers and indicate which is the sandbox."""
-        try:
-            result = subprocess.run(
-                [
-                    "podman", "ps", "-a",
-                    "--format", "{{.Names}}|{{.Image}}|{{.Status}}|{{.CreatedAt}}"
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        Rows are yielded as podman streams them, so printing can start before
+        the full container table has been parsed. The sandbox is tagged in
+        the same pass with the name bound once up front.
+        """
+        sandbox_name = self.CONTAINER_NAME
 
-            containers = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split("|")
-                if len(parts) >= 4:
-                    name, image, status, created = parts[0], parts[1], parts[2], parts[3]
-                    containers.append({
-                        "name": name,
-                        "image": image,
-                        "status": status,
-                        "created": created,
-                        "is_sandbox": name == self.CONTAINER_NAME,
-                    })
-
-            return containers
-        except subprocess.CalledProcessError:
-            return []
+        reply = _api_get("/containers/json?all=true")
+        if reply is not None:
+            http_status, data = reply
+            if http_status == 200 and isinstance(data, list):
+                for c in data:
+                    yield _container_row(c, sandbox_name)
+            return
+
+        # One JSON object per line, so rows can be parsed as they arrive.
+        # The pipe stays in binary mode: json.loads takes the raw bytes,
+        # skipping the TextIOWrapper decode/newline pass over the stream.
+        proc = subprocess.Popen(
+            self._CMD_PS_ALL_JSON,
+            stdout=subprocess.PIPE,
+        )
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if line:
+                    yield _container_row(json.loads(line), sandbox_name)
+        finally:
+            proc.stdout.close()
+            proc.wait()
 
     def commit(self) -> str:
         """Commit the current container state to an image.
@@ -344,34 +1157,45 @@ class PodmanContainer:
             if self._committed_image_exists():
                 # Find all containers using the committed image
                 result = subprocess.run(
-                    ["podman", "ps", "-a", "--filter", f"ancestor={self.COMMITTED_IMAGE}", "--format", "{{.Names}}"],
+                    self._CMD_PS_ANCESTOR,
                     capture_output=True,
+                    close_fds=False,
                     text=True,
                     check=True,
                 )
 
-                # Remove containers using the old committed image (except the current one)
-                for container_name in result.stdout.strip().split("\n"):
-                    if container_name and container_name != self.CONTAINER_NAME:
-                        subprocess.run(
-                            ["podman", "rm", "-f", container_name],
-                            capture_output=True,
-                            check=False,
-                        )
+                # Remove containers using the old committed image (except the
+                # current one) — podman rm takes multiple names, so one
+                # invocation covers them all
+                stale = [
+                    name
+                    for name in result.stdout.strip().split("\n")
+                    if name and name != self.CONTAINER_NAME
+                ]
+                if stale:
+                    subprocess.run(
+                        [*_PODMAN, "rm", "-f", *stale],
+                        **_SILENT,
+                        check=False,
+                    )
 
                 # Now remove the old committed image
                 subprocess.run(
-                    ["podman", "rmi", "-f", self.COMMITTED_IMAGE],
-                    capture_output=True,
+                    self._CMD_RMI_F,
+                    **_SILENT,
                     check=False,  # Don't fail if image can't be removed
                 )
+                self._forget_image(self.COMMITTED_IMAGE)
 
             # Commit current container state
             subprocess.run(
-                ["podman", "commit", self.CONTAINER_NAME, self.COMMITTED_IMAGE],
-                capture_output=True,
+                self._CMD_COMMIT,
+                **_QUIET,
                 check=True,
             )
+            self._invalidate_state_cache()
+            self._local_images.add(self.COMMITTED_IMAGE)
+            self._remember_image(self.COMMITTED_IMAGE)
             return self.COMMITTED_IMAGE
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to commit container: {e}")
@@ -393,15 +1217,16 @@ class PodmanContainer:
             # because it references the committed image
             if self.exists():
                 subprocess.run(
-                    ["podman", "rm", "-f", self.CONTAINER_NAME],
-                    capture_output=True,
+                    self._CMD_RM_F,
+                    **_QUIET,
                     check=True,
                 )
 
             # Now remove the committed image
             result = subprocess.run(
-                ["podman", "rmi", self.COMMITTED_IMAGE],
+                self._CMD_RMI,
                 capture_output=True,
+                close_fds=False,
                 text=True,
                 check=False,
             )
@@ -409,6 +1234,27 @@ class PodmanContainer:
             if result.returncode != 0:
                 raise RuntimeError(f"Failed to remove image: {result.stderr}")
 
+            self._invalidate_state_cache()
+            self._local_images.discard(self.COMMITTED_IMAGE)
+            self._forget_image(self.COMMITTED_IMAGE)
             return True
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to reset: {e}")
+
+
+def read_config_only() -> dict:
+    """Read the on-disk config without constructing a PodmanContainer.
+
+    Fast path for scripted reads like 'configure --show': nothing beyond
+    the JSON file is touched, so no container state is probed and no
+    instance setup runs.
+    """
+    try:
+        with open(_CONFIG_FILE_STR, "rb") as f:
+            return _config_loads(f.read())
+    except FileNotFoundError:
+        return {
+            "memory_limit": None,
+            "image": PodmanContainer.DEFAULT_IMAGE,
+            "auto_commit": False,
+        }
@@ -6,24 +6,41 @@ from click.testing import CliRunner
 from podman_sandbox.cli import main
 
 
+def _remove_sandbox():
+    """Force-remove the sandbox container if present."""
+    subprocess.run(
+        ["podman", "rm", "-f", "podman-sandbox"],
+        capture_output=True,
+    )
+
+
+# Module level rather than an instance method: pytest deprecated
+# class-scoped fixtures defined as instance methods (PytestRemovedIn10Warning)
+@pytest.fixture(autouse=True, scope="class")
+def _clean_class():
+    """Scrub once around the whole class.
+
+    Read-only tests (version, configure, list) don't care about
+    container state, so they share this single cleanup instead of
+    paying a podman fork in setup and teardown of every test.
+    """
+    _remove_sandbox()
+    yield
+    _remove_sandbox()
+
+
+@pytest.fixture
+def clean_container():
+    """Per-test scrub for tests that must start with no container."""
+    _remove_sandbox()
+    yield
+    _remove_sandbox()
+
+
 class TestCLI:
     """Test the CLI commands."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.runner = CliRunner()
-        # Clean up any existing containers
-        subprocess.run(
-            ["podman", "rm", "-f", "podman-sandbox"],
-            capture_output=True,
-        )
-
-    def teardown_method(self):
-        """Cleanup after tests."""
-        subprocess.run(
-            ["podman", "rm", "-f", "podman-sandbox"],
-            capture_output=True,
-        )
+    runner = CliRunner()
 
     def test_version(self):
         """Test version command."""
@@ -48,13 +65,13 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Configuration updated successfully" in result.output
 
-    def test_status_when_not_created(self):
+    def test_status_when_not_created(self, clean_container):
         """Test status when container doesn't exist."""
         result = self.runner.invoke(main, ["status"])
         assert result.exit_code == 0
         assert "not_created" in result.output
 
-    def test_start_and_stop(self):
+    def test_start_and_stop(self, clean_container):
         """Test starting and stopping the container."""
         # Start container
         result = self.runner.invoke(main, ["start"])
@@ -71,7 +88,7 @@ class TestCLI:
         assert result.exit_code == 0
         assert "stopped successfully" in result.output
 
-    def test_execute_command(self):
+    def test_execute_command(self, clean_container):
         """Test executing a command in the container."""
         # Start container first
         self.runner.invoke(main, ["start"])
@@ -83,13 +100,13 @@ class TestCLI:
         # Clean up
         self.runner.invoke(main, ["stop"])
 
-    def test_execute_without_starting(self):
+    def test_execute_without_starting(self, clean_container):
         """Test that execute fails if container is not running."""
         result = self.runner.invoke(main, ["execute", "ls"])
         assert result.exit_code == 1
         assert "not running" in result.output
 
-    def test_start_twice_fails(self):
+    def test_start_twice_fails(self, clean_container):
         """Test that starting an already running container fails."""
         # Start first time
         self.runner.invoke(main, ["start"])
@@ -107,7 +124,7 @@ class TestCLI:
         result = self.runner.invoke(main, ["list"])
         assert result.exit_code == 0
 
-    def test_list_with_sandbox_running(self):
+    def test_list_with_sandbox_running(self, clean_container):
         """Test listing containers when sandbox is running."""
         # Start sandbox
         self.runner.invoke(main, ["start"])